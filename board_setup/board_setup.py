@@ -1,4 +1,7 @@
 import random
+
+from fleet_oracle import FleetOracle
+from strategy.strategy import SHAPES
 """
 board_setup.py
 
@@ -6,33 +9,53 @@ This module contains the BoardSetup class responsible for:
  - Initializing and resetting a 2D board (0 = water, 1..7 = ship ID).
  - Placing ships according to a dict {ship_id: count}.
  - Providing board statistics and individual tile lookups.
+
+With sparse=True the board is kept as a dict {(x, y): ship_id} holding only
+occupied tiles, plus a set of tiles blocked for placement (ships and their
+orthogonal neighbours), so memory and time scale with the fleet, not the area.
 """
 
 class BoardSetup:
-    def __init__(self, rows: int, cols: int, ships_dict: dict[int, int]):
+    def __init__(self, rows: int, cols: int, ships_dict: dict[int, int], sparse: bool = False,
+                 oracle: FleetOracle | None = None, check_fleet: bool = True):
         """
         Initializes BoardSetup.
         :param rows: Number of rows in the board.
         :param cols: Number of columns in the board.
         :param ships_dict: Dictionary mapping ship_id -> count.
                            e.g. {1: 2, 2: 1, 3: 1, ...}
+        :param sparse: If True, store only occupied tiles (for huge, mostly empty boards).
+        :param oracle: FleetOracle used by place_ships() to reject impossible fleets.
+                       If None, only the oracle's cheap bounds are checked.
+        :param check_fleet: If False, place_ships() skips the fleet check.
         """
         # Tady si uložíme počet řádků, sloupců a lodí
         self.rows = rows
         self.cols = cols
         self.ships_dict = ships_dict
         self.total_blocks = rows * cols
-        # Tady vytvoříme 2D pole pro board: 0 = voda, 1..7 = ID lodě (viz examples)
-        self.board = [[0 for _ in range(cols)] for _ in range(rows)]
+        self.sparse = sparse
+        self.oracle = oracle
+        self.check_fleet = check_fleet
+        self.reset_board()
 
-    def get_board(self) -> list[list[int]]:
+    def get_board(self) -> list[list[int]] | dict[tuple[int, int], int]:
         """
         Returns the current 2D board state.
         0 = water, 1..7 = specific ship ID.
+        In sparse mode returns a dict {(x, y): ship_id} of occupied tiles only.
         """
         return self.board
         raise NotImplementedError("get_board() is not implemented yet.")
 
+    def get_occupied_tiles(self) -> dict[tuple[int, int], int]:
+        """
+        Returns a dict {(x, y): ship_id} of all occupied tiles.
+        """
+        if self.sparse:
+            return dict(self.board)
+        return {(x, y): tile for y, row in enumerate(self.board) for x, tile in enumerate(row) if tile != 0}
+
     def get_tile(self, x: int, y: int) -> int:
         """
         Returns the value at board coordinate (x, y).
@@ -43,6 +66,8 @@ class BoardSetup:
         """
         if (x < 0 or x >= self.cols) or (y < 0 or y >= self.rows):
             raise IndexError("Coordinates out of bounds.")  
+        if self.sparse:
+            return self.board.get((x, y), 0)
         return self.board[y][x]
         raise NotImplementedError("get_tile() is not implemented yet.")
 
@@ -55,17 +80,18 @@ class BoardSetup:
         - Ships cannot be placed with touching sides (diagonals are OK).
         - If it's impossible, raises ValueError.
         """
+        # Flotilu, která se prokazatelně nevejde, odmítneme hned a ne až po všech pokusech
+        if self.check_fleet:
+            if self.oracle is not None:
+                verdict = self.oracle.verdict(self.rows, self.cols, self.ships_dict)
+            else:
+                verdict = FleetOracle.quick_verdict(self.rows, self.cols, self.ships_dict)
+            # Jen prokázané False, při None (nevíme) zkoušíme lodě rozmístit
+            if verdict is False:
+                raise ValueError("Lodě se na board nevejdou")
 
-        shapes = {
-            1: [(0, 0), (0, 1)],  # 2x1 loď
-            2: [(0, 0), (0, 1), (0, 2)],  # 3x1 loď
-            3: [(0, 0), (0, 1), (0, 2), (0, 3)],  # 4x1 loď
-            4: [(0, 0), (0, 1), (0, 2), (1, 1)],  # Tvar "T"
-            5: [(0, 0), (1, 0), (2, 0), (2, 1)],  # Tvar "L"
-            6: [(0, 0), (0, 1), (1, 1), (1, 2)],  # Jiný "T" tvar
-            7: [(0, 0), (0, 1), (0, 2), (0, 3), (1, 1), (1, 2)]  # Delší Tvar
-        }
-
+        # Tvary jsou společné se Strategy a FleetOracle. Tady je bereme jako (dx, dy),
+        # tedy transponované, ale zkoušíme všechna otočení i zrcadlení, takže je to jedno.
         def rotate(shape):
             """Rotates the shape 90 degrees clockwise."""
             return [(dy, -dx) for dx, dy in shape]
@@ -79,6 +105,11 @@ class BoardSetup:
                 nx, ny = x + dx, y + dy
                 if not (0 <= nx < self.cols and 0 <= ny < self.rows):
                     return False
+                if self.sparse:
+                    # V blocked jsou lodě i jejich sousedi, stačí jeden dotaz
+                    if (nx, ny) in self.blocked:
+                        return False
+                    continue
                 if self.board[ny][nx] != 0:
                     return False
                 for adj_x, adj_y in [(nx-1, ny), (nx+1, ny), (nx, ny-1), (nx, ny+1)]:
@@ -95,13 +126,13 @@ class BoardSetup:
                 while not placed and attempts > 0:
                     x = random.randint(0, self.cols - 1)
                     y = random.randint(0, self.rows - 1)
-                    ship_shape = shapes.get(ship_id, [(0, 0)])
+                    ship_shape = SHAPES.get(ship_id, [(0, 0)])
 
                     for _ in range(2):
                         for _ in range(4):
                             if can_place_ship(x, y, ship_shape):
                                 for dx, dy in ship_shape:
-                                    self.board[y + dy][x + dx] = ship_id
+                                    self._set_tile(x + dx, y + dy, ship_id)
                                 placed = True
                                 break
                             ship_shape = rotate(ship_shape)
@@ -111,17 +142,30 @@ class BoardSetup:
                     attempts -= 1
                     failed_attempts_streak = failed_attempts_streak + 1 if not placed else 0
                     if failed_attempts_streak > 1000:
-                        self.board = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+                        self.reset_board()
                         failed_attempts_streak = 0
                 if not placed:
                     raise ValueError(f"Nepodařilo se umístit loď {ship_id}")
-                
-        
+
+    def _set_tile(self, x: int, y: int, ship_id: int) -> None:
+        """
+        Writes ship_id to (x, y). In sparse mode also blocks the tile and its neighbours.
+        """
+        if not self.sparse:
+            self.board[y][x] = ship_id
+            return
+        self.board[(x, y)] = ship_id
+        self.blocked.update([(x, y), (x-1, y), (x+1, y), (x, y-1), (x, y+1)])
 
     def reset_board(self) -> None:
         """
         Resets the board back to all 0 (water).
         """
+        if self.sparse:
+            # Jen obsazená pole a pole, kam se nesmí dát další loď
+            self.board = {}
+            self.blocked = set()
+            return
         self.board = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
         #raise NotImplementedError("reset_board() is not implemented yet.")
 
@@ -133,9 +177,13 @@ class BoardSetup:
               "occupied_spaces": <int>
             }
         """
+        if self.sparse:
+            occupied = len(self.board)
+        else:
+            occupied = self.total_blocks - sum(row.count(0) for row in self.board)
         return {
-            "empty_spaces": sum(row.count(0) for row in self.board),
-            "occupied_spaces": self.total_blocks - sum(row.count(0) for row in self.board)
+            "empty_spaces": self.total_blocks - occupied,
+            "occupied_spaces": occupied
         }
         # Tady spočítáme a vrátíme statistiky boardu
         raise NotImplementedError("board_stats() is not implemented yet.")
@@ -0,0 +1 @@
+from .fleet_oracle import FleetOracle, get_footprint, get_variants
\ No newline at end of file
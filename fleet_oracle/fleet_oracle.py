@@ -0,0 +1,298 @@
+"""
+fleet_oracle.py
+
+This module contains the FleetOracle class responsible for:
+ - Answering whether a fleet {ship_id: count} fits on a rows x cols board
+   under the no-touching-sides rule.
+ - Finding how many times a fleet (with the same ratio of ships) fits,
+   e.g. {1: 2, 3: 1} -> {1: 4, 3: 2}. Shapes are not mixed freely.
+ - Remembering verdicts in a memo, optionally persisted to a JSON-lines file.
+
+A verdict is decided by the cheapest test that can decide it:
+ 1. Upper bound: every ship together with the tile right of each of its tiles
+    occupies a disjoint area of a rows x (cols + 1) board (per-row packing).
+ 2. Lower bound: shelf packing of bounding boxes with a gap of one tile.
+ 3. Exact backtracking search, limited by search_budget steps
+    and only for boards up to MAX_SEARCH_AREA tiles.
+"""
+
+import json
+import os
+
+from strategy.strategy import SHAPE_VARIANTS
+
+# Neznámé ID lodě bere BoardSetup jako loď o jednom poli
+SINGLE_TILE = {((0, 0),)}
+# Větší board už přesně neprohledáváme (hustá mřížka by se nevešla do paměti)
+MAX_SEARCH_AREA = 1_000_000
+
+
+def get_variants(ship_id: int) -> list[tuple[tuple[int, int], ...]]:
+    """
+    Returns all rotations/reflections of the ship as sorted (y, x) offsets.
+    """
+    return sorted(SHAPE_VARIANTS.get(ship_id, SINGLE_TILE))
+
+
+def get_footprint(ship_id: int) -> int:
+    """
+    Returns the smallest number of tiles the ship needs in its row-packing:
+    its own tiles plus one water tile after each horizontal run.
+    """
+    return min(len(variant) + sum((y, x - 1) not in variant for y, x in variant)
+               for variant in get_variants(ship_id))
+
+
+def get_size(variant) -> tuple[int, int]:
+    """
+    Returns (height, width) of the variant's bounding box.
+    """
+    return max(y for y, x in variant) + 1, max(x for y, x in variant) + 1
+
+
+class FleetOracle:
+    def __init__(self, memo_path: str | None = None, search_budget: int = 100_000):
+        """
+        Initializes FleetOracle.
+        :param memo_path: Optional JSON-lines file where verdicts are persisted.
+        :param search_budget: Max number of steps (scanned tiles and tried ship variants)
+                              of the exact search.
+        """
+        self.memo_path = memo_path
+        self.search_budget = search_budget
+        self.memo = {}
+        # Nerozhodnuté flotily: klíč -> největší rozpočet, se kterým se to nepovedlo
+        self.unknown = {}
+        if memo_path and os.path.exists(memo_path):
+            with open(memo_path) as file:
+                for line in file:
+                    # Poškozený (např. useknutý poslední) řádek přeskočíme
+                    try:
+                        record = json.loads(line)
+                        rows, cols, fleet = record["key"]
+                        key = (rows, cols, tuple(tuple(item) for item in fleet))
+                        fits = record["fits"]
+                        budget = record["budget"] if fits is None else None
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    if fits is None:
+                        self.unknown[key] = max(self.unknown.get(key, 0), budget)
+                    else:
+                        self.memo[key] = fits
+
+    @staticmethod
+    def normalize(rows: int, cols: int, ships_dict: dict[int, int]) -> tuple:
+        """
+        Returns the memo key. All ship shapes can rotate, so a board and
+        its transposition give the same verdict.
+        """
+        fleet = tuple(sorted((ship_id, count) for ship_id, count in ships_dict.items() if count > 0))
+        return min(rows, cols), max(rows, cols), fleet
+
+    @classmethod
+    def quick_verdict(cls, rows: int, cols: int, ships_dict: dict[int, int]) -> bool | None:
+        """
+        Runs only the cheap tests (bounds and shelf packing), without search or memo.
+        Returns True/False when they decide the fleet, otherwise None.
+        """
+        rows, cols, fleet = cls.normalize(rows, cols, ships_dict)
+        if not fleet:
+            return True
+        if not cls._within_bounds(rows, cols, fleet):
+            return False
+        if cls._shelf_fit(rows, cols, fleet):
+            return True
+        return None
+
+    def verdict(self, rows: int, cols: int, ships_dict: dict[int, int]) -> bool | None:
+        """
+        Returns True if the fleet fits, False if it provably does not fit,
+        or None if the exact search ran out of search_budget.
+        None is memoized together with the budget, so only an oracle
+        with a bigger search_budget searches again.
+        """
+        key = self.normalize(rows, cols, ships_dict)
+        if key in self.memo:
+            return self.memo[key]
+        if self.unknown.get(key, -1) >= self.search_budget:
+            return None
+
+        rows, cols, fleet = key
+        result = self.quick_verdict(rows, cols, ships_dict)
+        if result is None:
+            result = self._exact_fit(rows, cols, fleet)
+
+        record = {"key": [rows, cols, fleet], "fits": result}
+        if result is None:
+            self.unknown[key] = self.search_budget
+            record["budget"] = self.search_budget
+        else:
+            self.unknown.pop(key, None)
+            self.memo[key] = result
+        if self.memo_path:
+            with open(self.memo_path, 'a') as file:
+                file.write(json.dumps(record) + "\n")
+        return result
+
+    def can_fit(self, rows: int, cols: int, ships_dict: dict[int, int]) -> bool:
+        """
+        Returns True only if a valid placement of the fleet was found.
+        """
+        return self.verdict(rows, cols, ships_dict) is True
+
+    def capacity(self, rows: int, cols: int, ships_dict: dict[int, int]) -> int:
+        """
+        Returns m such that the fleet with every count multiplied by m fits
+        (a placement was found). Raises ValueError for an empty fleet.
+
+        The binary search treats an undecided verdict (None) as "does not fit",
+        so m is only a lower bound. It is the largest such m when every
+        verdict on the way was decided.
+        """
+        fleet = {ship_id: count for ship_id, count in ships_dict.items() if count > 0}
+        if not fleet:
+            raise ValueError("Fleet is empty.")
+        unit = sum(count * get_footprint(ship_id) for ship_id, count in fleet.items())
+        # Víc než horní mez se nevejde, mezi 0 a horní mezí hledáme půlením
+        low, high = 0, min(rows * (cols + 1), (rows + 1) * cols) // unit
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.can_fit(rows, cols, {ship_id: count * middle for ship_id, count in fleet.items()}):
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def densest_fleet(self, rows: int, cols: int, ships_dict: dict[int, int]) -> dict[int, int]:
+        """
+        Returns ships_dict scaled by capacity(), i.e. the densest fleet with
+        the same ratio of ship types. It does not search other mixes of shapes:
+        on 3x3, {2: 1, 3: 1} gives {2: 0, 3: 0} although {2: 2} fits.
+        """
+        multiplier = self.capacity(rows, cols, ships_dict)
+        return {ship_id: count * multiplier for ship_id, count in ships_dict.items() if count > 0}
+
+    @staticmethod
+    def _within_bounds(rows: int, cols: int, fleet: tuple) -> bool:
+        """
+        Necessary condition: every ship fits the board and the fleet's
+        footprints fit in rows x (cols + 1) and (rows + 1) x cols.
+        """
+        for ship_id, _ in fleet:
+            if not any(h <= rows and w <= cols for h, w in map(get_size, get_variants(ship_id))):
+                return False
+        needed = sum(count * get_footprint(ship_id) for ship_id, count in fleet)
+        return needed <= min(rows * (cols + 1), (rows + 1) * cols)
+
+    @staticmethod
+    def _shelf_fit(rows: int, cols: int, fleet: tuple) -> bool:
+        """
+        Sufficient condition: bounding boxes placed on shelves, one tile apart,
+        tallest first (first fit decreasing height). Runs in O(ships).
+        """
+        boxes = []
+        for ship_id, count in fleet:
+            # Nejnižší natočení, které se vejde na šířku
+            sizes = [(h, w) for h, w in map(get_size, get_variants(ship_id)) if w <= cols]
+            if not sizes:
+                return False
+            boxes.append((min(sizes), count))
+        boxes.sort(reverse=True)
+
+        # Každá police: [výška, zbývající šířka]
+        shelves = []
+        used_height = -1
+        for (height, width), count in boxes:
+            for shelf in shelves:
+                if count == 0:
+                    break
+                fits = min(count, (shelf[1] + 1) // (width + 1))
+                shelf[1] -= fits * (width + 1)
+                count -= fits
+            while count > 0:
+                used_height += height + 1
+                if used_height > rows:
+                    return False
+                fits = min(count, (cols + 1) // (width + 1))
+                shelves.append([height, cols - fits * (width + 1)])
+                count -= fits
+        return True
+
+    def _exact_fit(self, rows: int, cols: int, fleet: tuple) -> bool | None:
+        """
+        Backtracking search. Each ship is anchored at its first tile in row-major
+        order, so tiles before the current position are final.
+        Returns None if search_budget runs out or the board is larger than MAX_SEARCH_AREA.
+        """
+        if rows * cols > MAX_SEARCH_AREA:
+            return None
+        grid = [[False] * cols for _ in range(rows)]
+        counts = dict(fleet)
+        footprints = {ship_id: get_footprint(ship_id) for ship_id in counts}
+        anchored = {}
+        for ship_id in counts:
+            anchored[ship_id] = []
+            for variant in get_variants(ship_id):
+                first_y, first_x = variant[0]
+                anchored[ship_id].append([(y - first_y, x - first_x) for y, x in variant])
+
+        def is_free(y, x):
+            if not (0 <= y < rows and 0 <= x < cols) or grid[y][x]:
+                return False
+            for ny, nx in [(y-1, x), (y+1, x), (y, x-1), (y, x+1)]:
+                if 0 <= ny < rows and 0 <= nx < cols and grid[ny][nx]:
+                    return False
+            return True
+
+        def placements(start, needed):
+            """Yields (position, ship_id, tiles) for every ship that can be anchored from start on."""
+            for position in range(start, rows * cols):
+                # Rozpočet platí i prohledávání, nejen položené lodě
+                budget[0] -= 1
+                if budget[0] < 0:
+                    return
+                y, x = divmod(position, cols)
+                # Horní mez na zbytku boardu (stejná jako v _within_bounds)
+                if needed > (rows - y) * (cols + 1) - x:
+                    return
+                if not is_free(y, x):
+                    continue
+                for ship_id, count in counts.items():
+                    if count == 0:
+                        continue
+                    for offsets in anchored[ship_id]:
+                        budget[0] -= 1
+                        tiles = [(y + dy, x + dx) for dy, dx in offsets]
+                        if all(is_free(ty, tx) for ty, tx in tiles):
+                            yield position, ship_id, tiles
+
+        def set_ship(ship_id, tiles, value):
+            for ty, tx in tiles:
+                grid[ty][tx] = value
+            counts[ship_id] += -1 if value else 1
+
+        # Vlastní zásobník místo rekurze: jedna úroveň na každou položenou loď,
+        # takže ani flotila s tisíci lodí nenarazí na limit rekurze
+        needed = sum(count * footprints[ship_id] for ship_id, count in fleet)
+        stack = [placements(0, needed)]
+        placed = []
+        budget = [self.search_budget]
+        while stack:
+            candidate = next(stack[-1], None)
+            if budget[0] < 0:
+                return None
+            if candidate is None:
+                stack.pop()
+                if placed:
+                    ship_id, tiles = placed.pop()
+                    set_ship(ship_id, tiles, False)
+                    needed += footprints[ship_id]
+                continue
+            position, ship_id, tiles = candidate
+            set_ship(ship_id, tiles, True)
+            needed -= footprints[ship_id]
+            placed.append((ship_id, tiles))
+            if needed == 0:
+                return True
+            stack.append(placements(position + 1, needed))
+        return False
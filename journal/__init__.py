@@ -0,0 +1 @@
+from .journal import GameJournal, JournaledStrategy, JournalReader, find_ships, replay_game, replay_games
\ No newline at end of file
@@ -0,0 +1,343 @@
+"""
+journal.py
+
+This module records games so they can be replayed later:
+ - GameJournal writes an append-only binary log per game
+   (board record + varint-encoded stream of shots and results).
+ - JournaledStrategy is a Strategy that writes every register_attack call.
+ - JournalReader reads a log and can seek to move N using checkpoints.
+ - find_ships splits occupied tiles into individual ships.
+ - replay_games re-runs logged games through another Strategy and reports diffs.
+
+File layout (all integers are unsigned LEB128 varints):
+    b'BSJ1' rows cols n_types (ship_id count)*n_types
+    n_tiles (index_delta ship_id)*n_tiles          index = y * cols + x
+    shot*                                           (index << 2) | (is_hit << 1) | is_sunk
+    footer: n_checkpoints (shot_delta offset_delta)*n_checkpoints
+            8 byte little-endian footer offset, b'BSJE'
+The header is written right away and the buffer is flushed at every checkpoint,
+so a crashed game is readable up to its last checkpoint. The footer is written
+on close(); logs without it are scanned instead.
+"""
+
+import struct
+
+from board_setup import BoardSetup
+from strategy import Strategy
+
+MAGIC = b'BSJ1'
+FOOTER_MAGIC = b'BSJE'
+# Po kolika bytech bufferu zapisujeme na disk
+FLUSH_SIZE = 1 << 16
+# Od této plochy přehráváme hru se sparse Strategy
+SPARSE_AREA = 1_000_000
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    """
+    Appends value as an unsigned LEB128 varint to out.
+    """
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """
+    Decodes a varint from data at pos. Returns (value, new_pos).
+    Raises ValueError if the data ends in the middle of a varint.
+    """
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Truncated varint in journal.")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def find_ships(tiles) -> list[set[tuple[int, int]]]:
+    """
+    Splits occupied tiles {(x, y), ...} into ships. Ships never touch by sides,
+    so every side-connected group of tiles is one ship.
+    """
+    ships = []
+    seen = set()
+    for tile in tiles:
+        if tile in seen:
+            continue
+        seen.add(tile)
+        ship = set()
+        stack = [tile]
+        while stack:
+            x, y = stack.pop()
+            ship.add((x, y))
+            for neighbour in [(x-1, y), (x+1, y), (x, y-1), (x, y+1)]:
+                if neighbour in tiles and neighbour not in seen:
+                    seen.add(neighbour)
+                    stack.append(neighbour)
+        ships.append(ship)
+    return ships
+
+
+class GameJournal:
+    def __init__(self, path: str, board: BoardSetup, checkpoint_every: int = 1024):
+        """
+        Opens a new journal and writes the board record.
+        :param path: Path of the log file (overwritten if it exists).
+        :param board: Board with ships already placed.
+        :param checkpoint_every: Number of shots between two checkpoints.
+        """
+        self.rows = board.rows
+        self.cols = board.cols
+        self.checkpoint_every = checkpoint_every
+        self.shots = 0
+        # Dvojice (číslo tahu, offset v souboru) pro rychlé hledání tahu N
+        self.checkpoints = []
+        self.file = open(path, 'wb')
+        self.buffer = bytearray(MAGIC)
+
+        encode_varint(board.rows, self.buffer)
+        encode_varint(board.cols, self.buffer)
+        encode_varint(len(board.ships_dict), self.buffer)
+        for ship_id, count in board.ships_dict.items():
+            encode_varint(ship_id, self.buffer)
+            encode_varint(count, self.buffer)
+
+        tiles = sorted((y * board.cols + x, ship_id) for (x, y), ship_id in board.get_occupied_tiles().items())
+        encode_varint(len(tiles), self.buffer)
+        previous = 0
+        for index, ship_id in tiles:
+            encode_varint(index - previous, self.buffer)
+            encode_varint(ship_id, self.buffer)
+            previous = index
+        self.offset = len(self.buffer)
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered bytes to the file, so a crashed game stays readable.
+        """
+        self.file.write(self.buffer)
+        self.file.flush()
+        self.buffer.clear()
+
+    def record_attack(self, x: int, y: int, is_hit: bool, is_sunk: bool) -> None:
+        """
+        Appends one shot and its result to the log.
+
+        Raises an IndexError if the coordinates are out of bounds.
+        """
+        if (x < 0 or x >= self.cols) or (y < 0 or y >= self.rows):
+            raise IndexError("Coordinates out of bounds.")
+        if self.shots % self.checkpoint_every == 0:
+            # Vše před checkpointem musí být na disku i bez close()
+            self.flush()
+            self.checkpoints.append((self.shots, self.offset))
+        size = len(self.buffer)
+        encode_varint(((y * self.cols + x) << 2) | (is_hit << 1) | is_sunk, self.buffer)
+        self.offset += len(self.buffer) - size
+        self.shots += 1
+        if len(self.buffer) >= FLUSH_SIZE:
+            self.flush()
+
+    def close(self) -> None:
+        """
+        Writes the checkpoint footer and closes the file.
+        """
+        if self.file.closed:
+            return
+        footer_offset = self.offset
+        encode_varint(len(self.checkpoints), self.buffer)
+        previous_shot, previous_offset = 0, 0
+        for shot, offset in self.checkpoints:
+            encode_varint(shot - previous_shot, self.buffer)
+            encode_varint(offset - previous_offset, self.buffer)
+            previous_shot, previous_offset = shot, offset
+        self.buffer += struct.pack('<Q', footer_offset) + FOOTER_MAGIC
+        self.file.write(self.buffer)
+        self.buffer.clear()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class JournaledStrategy(Strategy):
+    def __init__(self, rows: int, cols: int, ships_dict: dict[int, int], journal: GameJournal, sparse: bool = False):
+        """
+        Strategy that writes every register_attack call into the journal.
+        :param journal: Open GameJournal of the current game.
+        """
+        super().__init__(rows, cols, ships_dict, sparse)
+        self.journal = journal
+
+    def register_attack(self, x: int, y: int, is_hit: bool, is_sunk: bool) -> None:
+        """
+        Logs the shot, then updates the Strategy as usual.
+        """
+        self.journal.record_attack(x, y, is_hit, is_sunk)
+        super().register_attack(x, y, is_hit, is_sunk)
+
+
+class JournalReader:
+    def __init__(self, path: str):
+        """
+        Reads the board record and the checkpoint table of a journal.
+        Raises ValueError if the file is not a journal.
+        """
+        with open(path, 'rb') as file:
+            self.data = file.read()
+        if self.data[:4] != MAGIC:
+            raise ValueError(f"{path} is not a game journal.")
+
+        pos = 4
+        self.rows, pos = decode_varint(self.data, pos)
+        self.cols, pos = decode_varint(self.data, pos)
+        n_types, pos = decode_varint(self.data, pos)
+        self.ships_dict = {}
+        for _ in range(n_types):
+            ship_id, pos = decode_varint(self.data, pos)
+            self.ships_dict[ship_id], pos = decode_varint(self.data, pos)
+
+        n_tiles, pos = decode_varint(self.data, pos)
+        self.tiles = {}
+        index = 0
+        for _ in range(n_tiles):
+            delta, pos = decode_varint(self.data, pos)
+            index += delta
+            ship_id, pos = decode_varint(self.data, pos)
+            self.tiles[(index % self.cols, index // self.cols)] = ship_id
+        self.shots_start = pos
+
+        footer = self._read_footer()
+        if footer is None:
+            # Hra nebyla uzavřena, bereme všechno do konce souboru
+            self.shots_end = len(self.data)
+            self.checkpoints = [(0, self.shots_start)]
+        else:
+            self.shots_end, checkpoints = footer
+            self.checkpoints = [(0, self.shots_start)] + checkpoints
+
+    def _read_footer(self) -> tuple[int, list[tuple[int, int]]] | None:
+        """
+        Returns (footer_offset, checkpoints) or None if the file has no valid footer.
+        The last bytes of an unclosed log are shots, which may look like b'BSJE',
+        so the offset and the checkpoint table are checked as well.
+        """
+        table_end = len(self.data) - 12
+        if self.data[-4:] != FOOTER_MAGIC:
+            return None
+        footer_offset = struct.unpack('<Q', self.data[table_end:-4])[0]
+        if not self.shots_start <= footer_offset < table_end:
+            return None
+
+        table = self.data[:table_end]
+        checkpoints = []
+        try:
+            n_checkpoints, pos = decode_varint(table, footer_offset)
+            shot, offset = 0, 0
+            for _ in range(n_checkpoints):
+                delta, pos = decode_varint(table, pos)
+                shot += delta
+                delta, pos = decode_varint(table, pos)
+                offset += delta
+                checkpoints.append((shot, offset))
+        except ValueError:
+            return None
+        if pos != table_end:
+            return None
+        return footer_offset, checkpoints
+
+    def shots(self, start: int = 0):
+        """
+        Yields (x, y, is_hit, is_sunk) for every shot from move `start` on.
+        Jumps to the nearest checkpoint first, so only shots after it are decoded.
+        """
+        shot, pos = max(c for c in self.checkpoints if c[0] <= start)
+        while pos < self.shots_end:
+            value, pos = decode_varint(self.data, pos)
+            if shot >= start:
+                index = value >> 2
+                yield index % self.cols, index // self.cols, bool(value & 2), bool(value & 1)
+            shot += 1
+
+    def ships(self) -> list[set[tuple[int, int]]]:
+        """
+        Returns the tiles of each logged ship.
+        """
+        return find_ships(self.tiles)
+
+
+def replay_game(reader: JournalReader, strategy_factory=Strategy, sparse: bool | None = None) -> dict:
+    """
+    Plays the logged board again with a new Strategy and compares the shots.
+    :param strategy_factory: Callable (rows, cols, ships_dict, sparse=...) -> Strategy.
+    :param sparse: Passed to strategy_factory. If None, boards larger than
+                   SPARSE_AREA tiles are replayed with sparse=True.
+    Returns a dict:
+        {
+          "logged_shots": <int>,
+          "replayed_shots": <int>,
+          "first_difference": <move number where the shots differ, or None>
+        }
+    """
+    if sparse is None:
+        sparse = reader.rows * reader.cols > SPARSE_AREA
+    logged = reader.shots()
+    strategy = strategy_factory(reader.rows, reader.cols, dict(reader.ships_dict), sparse=sparse)
+    owner = {}
+    remaining = []
+    for ship in reader.ships():
+        remaining.append(len(ship))
+        for tile in ship:
+            owner[tile] = len(remaining) - 1
+    afloat = len(remaining)
+
+    replayed = 0
+    logged_shots = 0
+    first_difference = None
+    # Strategie, která se zacyklí, nesmí replay zaseknout
+    while afloat > 0 and replayed < reader.rows * reader.cols:
+        x, y = strategy.get_next_attack()
+        is_hit = (x, y) in owner
+        is_sunk = False
+        if is_hit:
+            ship = owner.pop((x, y))
+            remaining[ship] -= 1
+            is_sunk = remaining[ship] == 0
+            afloat -= is_sunk
+        strategy.register_attack(x, y, is_hit, is_sunk)
+        logged_shot = next(logged, None)
+        if logged_shot is not None:
+            logged_shots += 1
+        if first_difference is None and logged_shot != (x, y, is_hit, is_sunk):
+            first_difference = replayed
+        replayed += 1
+
+    # Původní hra mohla pokračovat i po našem posledním tahu
+    rest = sum(1 for _ in logged)
+    if first_difference is None and rest:
+        first_difference = replayed
+    return {
+        "logged_shots": logged_shots + rest,
+        "replayed_shots": replayed,
+        "first_difference": first_difference
+    }
+
+
+def replay_games(paths, strategy_factory=Strategy, sparse: bool | None = None):
+    """
+    Replays many journals one by one (constant memory).
+    Yields (path, diff) where diff is the dict returned by replay_game().
+    """
+    for path in paths:
+        yield path, replay_game(JournalReader(path), strategy_factory, sparse)
@@ -1,14 +1,13 @@
-from itertools import product
  
-# Definované tvary lodí (y, x)
+# Definované tvary lodí (y, x), jediná definice pro BoardSetup, Strategy i FleetOracle
 SHAPES = {
-    1: [(0, 0), (0, 1)],
-    2: [(0, 0), (0, 1), (0, 2)],
-    3: [(0, 0), (0, 1), (0, 2), (0, 3)],
-    4: [(0, 0), (0, 1), (0, 2), (1, 1)],
-    5: [(0, 0), (1, 0), (2, 0), (2, 1)],  
-    6: [(0, 0), (0, 1), (1, 1), (1, 2)],
-    7: [(0, 0), (0, 1), (0, 2), (0, 3), (1, 1), (1, 2)]  
+    1: [(0, 0), (0, 1)],  # 2x1 loď
+    2: [(0, 0), (0, 1), (0, 2)],  # 3x1 loď
+    3: [(0, 0), (0, 1), (0, 2), (0, 3)],  # 4x1 loď
+    4: [(0, 0), (0, 1), (0, 2), (1, 1)],  # Tvar "T"
+    5: [(0, 0), (1, 0), (2, 0), (2, 1)],  # Tvar "L"
+    6: [(0, 0), (0, 1), (1, 1), (1, 2)],  # Jiný "T" tvar
+    7: [(0, 0), (0, 1), (0, 2), (0, 3), (1, 1), (1, 2)]  # Delší Tvar
 }
  
 def generate_variants(shape):
@@ -35,7 +34,7 @@ def generate_variants(shape):
 SHAPE_VARIANTS = {key: generate_variants(value) for key, value in SHAPES.items()}
  
 class Strategy:
-    def __init__(self, rows: int, cols: int, ships_dict: dict[int, int]):
+    def __init__(self, rows: int, cols: int, ships_dict: dict[int, int], sparse: bool = False):
         """
         Initializes the Strategy.
  
@@ -43,15 +42,42 @@ class Strategy:
         :param cols: Number of columns in the enemy board.
         :param ships_dict: Dictionary mapping ship_id -> count for enemy ships.
                            e.g. {1: 2, 2: 1, 3: 1, ...}
+        :param sparse: If True, remember only attacked tiles as a dict {(x, y): mark}.
  
         The enemy board is initially unknown.
         """
         self.rows = rows
         self.cols = cols
         self.ships_dict = ships_dict
+        self.sparse = sparse
+        # Index (y * cols + x) prvního pole, které ještě může být neznámé
+        self.next_index = 0
+        # Zásahy, které ještě nepatří k potopené lodi
+        self.open_hits = []
        
-        # Tady vytvoříme 2D seznam otazníků '?', znamenající "neznámé pole"
-        self.enemy_board = [['?' for _ in range(cols)] for _ in range(rows)]
+        if sparse:
+            # Neznámá pole '?' neukládáme, jen pole, na která jsme stříleli
+            self.enemy_board = {}
+        else:
+            # Tady vytvoříme 2D seznam otazníků '?', znamenající "neznámé pole"
+            self.enemy_board = [['?' for _ in range(cols)] for _ in range(rows)]
+
+    def _get_mark(self, x: int, y: int) -> str:
+        """
+        Returns the mark at (x, y) regardless of the board representation.
+        """
+        if self.sparse:
+            return self.enemy_board.get((x, y), '?')
+        return self.enemy_board[y][x]
+
+    def _set_mark(self, x: int, y: int, mark: str) -> None:
+        """
+        Stores the mark at (x, y) regardless of the board representation.
+        """
+        if self.sparse:
+            self.enemy_board[(x, y)] = mark
+        else:
+            self.enemy_board[y][x] = mark
  
     def get_next_attack(self) -> tuple[int, int]:
         """
@@ -60,9 +86,12 @@ class Strategy:
         Must be within [0 .. cols-1], [0 .. rows-1].
         Assume we will never call this function if all ships are sunk.
         """
-        for y, x in product(range(self.rows), range(self.cols)):
-            if self.enemy_board[y][x] == '?':  # Neznámá pole
+        # Pole se nikdy nevrací zpět na '?', takže index jen posouváme dopředu
+        while self.next_index < self.rows * self.cols:
+            y, x = divmod(self.next_index, self.cols)
+            if self._get_mark(x, y) == '?':  # Neznámá pole
                 return x, y
+            self.next_index += 1
  
         raise RuntimeError("No available attack positions found!")
  
@@ -76,9 +105,10 @@ class Strategy:
         You should update the enemy board appropriately too.
         """
         if is_hit:
-            self.enemy_board[y][x] = 'H'  
+            self._set_mark(x, y, 'H')
+            self.open_hits.append((x, y))
         else:
-            self.enemy_board[y][x] = 'M'  
+            self._set_mark(x, y, 'M')
  
         if is_sunk:
             # Pokusíme se najít, která loď byla právě potopena
@@ -88,14 +118,14 @@ class Strategy:
                     break  
  
             # Označíme potopenou loď (S) pro lepší přehlednost
-            for row in range(self.rows):
-                for col in range(self.cols):
-                    if self.enemy_board[row][col] == 'H':
-                        self.enemy_board[row][col] = 'S'
+            for hit_x, hit_y in self.open_hits:
+                self._set_mark(hit_x, hit_y, 'S')
+            self.open_hits = []
  
-    def get_enemy_board(self) -> list[list[str]]:
+    def get_enemy_board(self) -> list[list[str]] | dict[tuple[int, int], str]:
         """
         Returns the current 2D state (knowledge) of the enemy board.
+        In sparse mode returns a dict {(x, y): mark} without the unknown '?' tiles.
         '?' = unknown, 'H' = hit, 'M' = miss.
         You may optionally use 'S' for sunk ships (not required).
         You may optionally use 'X' for tiles that are impossible to contain a ship (not required).
@@ -256,4 +256,45 @@ def test_board_stats_after_placement(one_ship_b: BoardSetup):
 
     assert stats["occupied_spaces"] == occupied, "occupied_spaces must match actual occupancy"
     assert stats["empty_spaces"] == total - occupied, "empty_spaces must match total minus occupied"
-    assert occupied == 3, "We expect exactly 3 cells be occupied for a board with one length-3 ship"
\ No newline at end of file
+    assert occupied == 3, "We expect exactly 3 cells be occupied for a board with one length-3 ship"
+
+# -----------------------------------------------------------------------------
+# Sparse mode Tests
+# -----------------------------------------------------------------------------
+
+def test_sparse_huge_board_placement():
+    """
+    A 100 000 x 100 000 sparse board must place ships without allocating the grid.
+    """
+    board = BoardSetup(rows=100_000, cols=100_000, ships_dict={1: 50, 7: 50}, sparse=True)
+    board.place_ships()
+    stats = board.board_stats()
+    assert stats["occupied_spaces"] == 50 * 2 + 50 * 6
+    assert stats["empty_spaces"] == 100_000 * 100_000 - stats["occupied_spaces"]
+    assert len(board.get_board()) == stats["occupied_spaces"]
+
+def test_sparse_get_tile_and_no_touching():
+    """
+    get_tile() works in sparse mode and placed ships never touch by sides.
+    """
+    board = BoardSetup(rows=10, cols=10, ships_dict={1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1, 7: 1}, sparse=True)
+    board.place_ships()
+    for (x, y), ship_id in board.get_board().items():
+        assert board.get_tile(x, y) == ship_id
+    with pytest.raises(IndexError):
+        board.get_tile(10, 0)
+    # Orthogonally adjacent tiles must belong to the same ship (same ID)
+    for (x, y), ship_id in board.get_board().items():
+        for nx, ny in [(x+1, y), (x, y+1)]:
+            if (nx, ny) in board.get_board():
+                assert board.get_board()[(nx, ny)] == ship_id
+
+def test_sparse_reset_board():
+    """
+    reset_board() in sparse mode clears all tiles.
+    """
+    board = BoardSetup(rows=1000, cols=1000, ships_dict={2: 3}, sparse=True)
+    board.place_ships()
+    board.reset_board()
+    assert board.get_board() == {}
+    assert board.board_stats()["occupied_spaces"] == 0
@@ -0,0 +1,212 @@
+import pytest
+from board_setup import BoardSetup
+from fleet_oracle import FleetOracle, get_footprint, get_variants
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+@pytest.fixture
+def oracle():
+    """
+    A fresh FleetOracle without a persistent memo.
+    """
+    return FleetOracle()
+
+# -----------------------------------------------------------------------------
+# Verdict Tests
+# -----------------------------------------------------------------------------
+
+def test_footprint():
+    """
+    A straight ship needs its tiles plus one water tile; the "T" ship needs two more.
+    """
+    assert get_footprint(1) == 3
+    assert get_footprint(3) == 5
+    assert get_footprint(4) == 6
+
+def test_empty_fleet_fits(oracle: FleetOracle):
+    """
+    An empty fleet always fits.
+    """
+    assert oracle.verdict(1, 1, {}) is True
+    assert oracle.verdict(5, 5, {1: 0}) is True
+
+def test_standard_fleets_fit(oracle: FleetOracle):
+    """
+    The fleets used in the BoardSetup tests fit on 10x10.
+    """
+    assert oracle.can_fit(10, 10, {1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1, 7: 1})
+    assert oracle.can_fit(10, 10, {1: 3, 2: 3, 3: 2, 4: 2, 5: 2})
+
+def test_ship_larger_than_board(oracle: FleetOracle):
+    """
+    A 4-long ship can't fit on 3x3, in any rotation.
+    """
+    assert oracle.verdict(3, 3, {3: 1}) is False
+
+def test_too_many_ships(oracle: FleetOracle):
+    """
+    The per-row bound rejects fleets without any search.
+    """
+    assert oracle.verdict(10, 10, {7: 30}) is False
+
+def test_exact_search(oracle: FleetOracle):
+    """
+    Tight fleets are decided by the exact search.
+    3x3 fits two 3-long ships (rows 0 and 2) but not three.
+    """
+    assert oracle.verdict(3, 3, {2: 2}) is True
+    assert oracle.verdict(3, 3, {2: 3}) is False
+    assert oracle.verdict(2, 2, {1: 2}) is False
+
+def test_exact_search_large_fleet(oracle: FleetOracle):
+    """
+    1700 ships pass the per-row bound but not the shelf packing (50 shelves x 33),
+    so the exact search places all of them without hitting the recursion limit.
+    """
+    assert oracle.verdict(100, 100, {1: 1700}) is True
+
+def test_exact_search_budget_runs_out(tmp_path):
+    """
+    When the budget runs out deep in the search, the verdict is None (unknown).
+    It is remembered with its budget, so only a bigger budget searches again.
+    """
+    path = tmp_path / "memo.jsonl"
+    oracle = FleetOracle(memo_path=path, search_budget=5000)
+    assert oracle.verdict(100, 100, {1: 2500}) is None
+    key = FleetOracle.normalize(100, 100, {1: 2500})
+    assert oracle.memo == {}
+    assert oracle.unknown == {key: 5000}
+
+    smaller = FleetOracle(memo_path=path, search_budget=1000)
+    assert smaller.unknown == {key: 5000}
+    assert smaller.verdict(100, 100, {1: 2500}) is None
+    assert len(path.read_text().splitlines()) == 1, "No new search for a smaller budget"
+
+    bigger = FleetOracle(memo_path=path, search_budget=6000)
+    assert bigger.verdict(100, 100, {1: 2500}) is None
+    assert len(path.read_text().splitlines()) == 2
+    assert FleetOracle(memo_path=path).unknown == {key: 6000}
+
+def test_quick_verdict():
+    """
+    quick_verdict() decides by bounds and shelf packing only, otherwise returns None.
+    """
+    assert FleetOracle.quick_verdict(10, 10, {7: 30}) is False
+    assert FleetOracle.quick_verdict(10, 10, {1: 1}) is True
+    assert FleetOracle.quick_verdict(10, 10, {1: 25}) is None
+
+def test_exact_search_budget_counts_scanning():
+    """
+    The budget also pays for scanning the board, so a tiny budget
+    gives up even when no ship placement was tried yet.
+    """
+    assert FleetOracle(search_budget=10).verdict(20, 20, {1: 60, 4: 20}) is None
+
+def test_exact_search_skips_huge_boards(oracle: FleetOracle):
+    """
+    A huge board that falls through to the exact search is not allocated densely.
+    """
+    assert FleetOracle.quick_verdict(2000, 2000, {1: 1_000_000}) is None
+    assert oracle.verdict(2000, 2000, {1: 1_000_000}) is None
+
+def test_transposed_board_is_same_key(oracle: FleetOracle):
+    """
+    rows x cols and cols x rows share the memo entry.
+    """
+    oracle.verdict(4, 9, {3: 2})
+    assert FleetOracle.normalize(9, 4, {3: 2}) in oracle.memo
+    assert len(oracle.memo) == 1
+    assert oracle.verdict(9, 4, {3: 2}) is True
+
+def test_huge_sparse_board(oracle: FleetOracle):
+    """
+    Huge boards with few ships are decided by the shelf packing right away.
+    """
+    assert oracle.can_fit(100_000, 100_000, {1: 300, 7: 300})
+
+# -----------------------------------------------------------------------------
+# Capacity Tests
+# -----------------------------------------------------------------------------
+
+def test_capacity(oracle: FleetOracle):
+    """
+    On 3x3 at most two 3-long ships fit; on 1x7 two 3-long ships fit.
+    """
+    assert oracle.capacity(3, 3, {2: 1}) == 2
+    assert oracle.capacity(1, 7, {2: 1}) == 2
+    assert oracle.densest_fleet(3, 3, {2: 1, 1: 0}) == {2: 2}
+    # Poměr lodí se zachovává, jiné kombinace tvarů se nezkoušejí
+    assert oracle.densest_fleet(3, 3, {2: 1, 3: 1}) == {2: 0, 3: 0}
+    with pytest.raises(ValueError):
+        oracle.capacity(3, 3, {})
+
+# -----------------------------------------------------------------------------
+# Persistence and BoardSetup Tests
+# -----------------------------------------------------------------------------
+
+def test_persistent_memo(tmp_path):
+    """
+    Verdicts written by one oracle are loaded by the next one.
+    """
+    path = tmp_path / "memo.jsonl"
+    FleetOracle(memo_path=path).verdict(3, 3, {2: 3})
+    reloaded = FleetOracle(memo_path=path)
+    assert reloaded.memo == {(3, 3, ((2, 3),)): False}
+    assert reloaded.verdict(3, 3, {2: 3}) is False
+
+def test_persistent_memo_skips_bad_lines(tmp_path):
+    """
+    A corrupt or truncated line in the memo file is skipped, not fatal.
+    """
+    path = tmp_path / "memo.jsonl"
+    FleetOracle(memo_path=path).verdict(3, 3, {2: 3})
+    with open(path, 'a') as file:
+        file.write('{"key": [3, 3, [[2, 2]]], "fi')
+    reloaded = FleetOracle(memo_path=path)
+    assert reloaded.memo == {(3, 3, ((2, 3),)): False}
+
+def test_board_setup_places_oracle_shapes():
+    """
+    BoardSetup places exactly the shapes the oracle knows (one shared definition).
+    """
+    for ship_id in range(1, 8):
+        board = BoardSetup(rows=10, cols=10, ships_dict={ship_id: 1})
+        board.place_ships()
+        tiles = board.get_occupied_tiles()
+        min_x = min(x for x, y in tiles)
+        min_y = min(y for x, y in tiles)
+        shape = tuple(sorted((y - min_y, x - min_x) for x, y in tiles))
+        assert shape in get_variants(ship_id)
+
+def test_board_setup_large_fleet_in_bounds_gap():
+    """
+    The cheap bounds can't decide 1700 ships on 100x100, so place_ships()
+    doesn't reject the fleet up front and falls back to random placement.
+    """
+    assert FleetOracle.quick_verdict(100, 100, {1: 1700}) is None
+    board = BoardSetup(rows=100, cols=100, ships_dict={1: 1700})
+    try:
+        board.place_ships()
+    except ValueError:
+        pass
+    # Náhodné pokusy proběhly, board tedy není prázdný
+    assert board.board_stats()["occupied_spaces"] > 0
+
+def test_board_setup_uses_injected_oracle(oracle: FleetOracle):
+    """
+    place_ships() asks the injected oracle, unless check_fleet is False.
+    """
+    BoardSetup(rows=10, cols=10, ships_dict={1: 1}, oracle=oracle, check_fleet=False).place_ships()
+    assert oracle.memo == {}
+    BoardSetup(rows=10, cols=10, ships_dict={1: 1}, oracle=oracle).place_ships()
+    assert oracle.memo == {(10, 10, ((1, 1),)): True}
+
+def test_board_setup_rejects_impossible_fleet():
+    """
+    place_ships() raises ValueError straight away for a fleet that can't fit.
+    """
+    board = BoardSetup(rows=10, cols=10, ships_dict={7: 30})
+    with pytest.raises(ValueError):
+        board.place_ships()
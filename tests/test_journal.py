@@ -0,0 +1,171 @@
+import pytest
+from board_setup import BoardSetup
+from strategy import Strategy
+from journal import GameJournal, JournaledStrategy, JournalReader, find_ships, replay_game, replay_games
+
+# -----------------------------------------------------------------------------
+# Helper function to play a whole logged game
+# -----------------------------------------------------------------------------
+
+def play_logged_game(path, rows, cols, ships_dict, checkpoint_every=1024):
+    """Places ships, plays the game with JournaledStrategy and returns (board, shots)."""
+    board = BoardSetup(rows=rows, cols=cols, ships_dict=dict(ships_dict))
+    board.place_ships()
+    shots = []
+    with GameJournal(path, board, checkpoint_every=checkpoint_every) as journal:
+        strategy = JournaledStrategy(rows, cols, dict(ships_dict), journal)
+        remaining = find_ships(board.get_occupied_tiles())
+        while any(remaining):
+            x, y = strategy.get_next_attack()
+            is_hit = board.get_tile(x, y) != 0
+            is_sunk = False
+            for ship in remaining:
+                if (x, y) in ship:
+                    ship.remove((x, y))
+                    is_sunk = not ship
+            strategy.register_attack(x, y, is_hit, is_sunk)
+            shots.append((x, y, is_hit, is_sunk))
+    return board, shots
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+@pytest.fixture
+def logged_game(tmp_path):
+    """
+    A finished 10x10 game with one of each ship ID, logged with small checkpoints.
+    """
+    path = tmp_path / "game.bsj"
+    board, shots = play_logged_game(path, 10, 10, {1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1, 7: 1}, checkpoint_every=7)
+    return path, board, shots
+
+# -----------------------------------------------------------------------------
+# Tests
+# -----------------------------------------------------------------------------
+
+def test_reader_board_record(logged_game):
+    """
+    The reader restores the board size, fleet and all occupied tiles.
+    """
+    path, board, _ = logged_game
+    reader = JournalReader(path)
+    assert (reader.rows, reader.cols) == (10, 10)
+    assert reader.ships_dict == {1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1, 7: 1}
+    assert reader.tiles == board.get_occupied_tiles()
+    assert len(reader.ships()) == 7
+
+def test_reader_shots_and_seek(logged_game):
+    """
+    All shots are read back and seeking to move N gives the same tail.
+    """
+    path, _, shots = logged_game
+    reader = JournalReader(path)
+    assert list(reader.shots()) == shots
+    assert len(reader.checkpoints) > 2
+    for start in (0, 6, 7, 30, len(shots) - 1, len(shots)):
+        assert list(reader.shots(start)) == shots[start:]
+
+def test_reader_without_footer(logged_game, tmp_path):
+    """
+    A log cut off before close() (no footer) is still readable.
+    """
+    path, _, shots = logged_game
+    reader = JournalReader(path)
+    cut = tmp_path / "cut.bsj"
+    cut.write_bytes(reader.data[:reader.shots_end])
+    assert list(JournalReader(cut).shots(5)) == shots[5:]
+
+def test_reader_unclosed_journal(tmp_path):
+    """
+    A journal that is never closed is readable up to its last checkpoint.
+    """
+    path = tmp_path / "crashed.bsj"
+    board = BoardSetup(rows=10, cols=10, ships_dict={1: 1})
+    board.place_ships()
+    journal = GameJournal(path, board, checkpoint_every=16)
+    shots = [(x, y, False, False) for y in range(5) for x in range(10)]
+    for shot in shots:
+        journal.record_attack(*shot)
+    reader = JournalReader(path)
+    assert reader.ships_dict == {1: 1}
+    assert list(reader.shots()) == shots[:48]
+    journal.close()
+
+def test_reader_shots_looking_like_footer(logged_game, tmp_path):
+    """
+    An unclosed log whose last shot bytes happen to be b'BSJE' is not
+    mistaken for a log with a footer.
+    """
+    path, _, shots = logged_game
+    reader = JournalReader(path)
+    # 'B', 'S', 'J', 'E' jsou platné jednobajtové varinty tahů
+    fake = tmp_path / "fake.bsj"
+    fake.write_bytes(reader.data[:reader.shots_end] + b"BSJE")
+    fake_reader = JournalReader(fake)
+    assert fake_reader.shots_end == len(fake_reader.data)
+    assert list(fake_reader.shots())[:len(shots)] == shots
+    assert len(list(fake_reader.shots())) == len(shots) + 4
+
+def test_record_attack_out_of_range(tmp_path):
+    """
+    record_attack() with out-of-range coords raises IndexError and logs nothing.
+    """
+    board = BoardSetup(rows=5, cols=5, ships_dict={})
+    with GameJournal(tmp_path / "game.bsj", board) as journal:
+        with pytest.raises(IndexError):
+            journal.record_attack(5, 0, is_hit=False, is_sunk=False)
+        with pytest.raises(IndexError):
+            journal.record_attack(0, -1, is_hit=False, is_sunk=False)
+    assert list(JournalReader(tmp_path / "game.bsj").shots()) == []
+
+def test_reader_rejects_other_files(tmp_path):
+    """
+    Files without the journal header raise ValueError.
+    """
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"hello")
+    with pytest.raises(ValueError):
+        JournalReader(path)
+
+def test_replay_same_strategy(logged_game):
+    """
+    Replaying with the same Strategy gives no difference.
+    """
+    path, _, shots = logged_game
+    diff = replay_game(JournalReader(path))
+    assert diff == {"logged_shots": len(shots), "replayed_shots": len(shots), "first_difference": None}
+
+def test_replay_games_reports_difference(logged_game):
+    """
+    A Strategy shooting column by column differs on the second move.
+    """
+    path, _, shots = logged_game
+
+    class ColumnStrategy(Strategy):
+        def get_next_attack(self):
+            for x in range(self.cols):
+                for y in range(self.rows):
+                    if self.enemy_board[y][x] == '?':
+                        return x, y
+
+    results = list(replay_games([path], ColumnStrategy))
+    assert len(results) == 1
+    assert results[0][0] == path
+    assert results[0][1]["first_difference"] == 1
+    assert results[0][1]["logged_shots"] == len(shots)
+
+def test_replay_huge_sparse_board(tmp_path):
+    """
+    A game on a 100 000 x 100 000 sparse board replays with a sparse Strategy.
+    """
+    path = tmp_path / "huge.bsj"
+    board = BoardSetup(rows=100_000, cols=100_000, ships_dict={1: 1}, sparse=True)
+    board._set_tile(0, 0, 1)
+    board._set_tile(1, 0, 1)
+    with GameJournal(path, board) as journal:
+        strategy = JournaledStrategy(100_000, 100_000, {1: 1}, journal, sparse=True)
+        strategy.register_attack(0, 0, is_hit=True, is_sunk=False)
+        strategy.register_attack(1, 0, is_hit=True, is_sunk=True)
+    diff = replay_game(JournalReader(path))
+    assert diff == {"logged_shots": 2, "replayed_shots": 2, "first_difference": None}
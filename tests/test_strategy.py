@@ -188,4 +188,35 @@ def test_sink_two_ships_small_strategy(small_strategy: Strategy):
     assert sum(small_strategy.get_remaining_ships().values()) == 1
     small_strategy.register_attack(2, 3, is_hit=True, is_sunk=True)
     assert sum(small_strategy.get_remaining_ships().values()) == 0, "No ships left"
-    assert small_strategy.all_ships_sunk(), "All ships should be sunk now"
\ No newline at end of file
+    assert small_strategy.all_ships_sunk(), "All ships should be sunk now"
+
+# -----------------------------------------------------------------------------
+# Sparse mode Tests
+# -----------------------------------------------------------------------------
+
+def test_sparse_strategy_huge_board():
+    """
+    A sparse 100 000 x 100 000 Strategy only stores tiles that were attacked.
+    """
+    strategy = Strategy(rows=100_000, cols=100_000, ships_dict={1: 1}, sparse=True)
+    assert strategy.get_enemy_board() == {}
+    x, y = strategy.get_next_attack()
+    assert (x, y) == (0, 0)
+    strategy.register_attack(x, y, is_hit=False, is_sunk=False)
+    assert strategy.get_next_attack() == (1, 0)
+    assert strategy.get_enemy_board() == {(0, 0): 'M'}
+
+def test_sparse_strategy_sink_marks():
+    """
+    Sinking marks the open hits as 'S' in sparse mode, same as in dense mode.
+    """
+    dense = Strategy(rows=5, cols=5, ships_dict={1: 1, 2: 1})
+    sparse = Strategy(rows=5, cols=5, ships_dict={1: 1, 2: 1}, sparse=True)
+    for strategy in (dense, sparse):
+        strategy.register_attack(0, 1, is_hit=True, is_sunk=False)
+        strategy.register_attack(1, 1, is_hit=True, is_sunk=True)
+        strategy.register_attack(0, 3, is_hit=True, is_sunk=False)
+    assert dense.get_enemy_board()[1][0] == 'S'
+    assert dense.get_enemy_board()[3][0] == 'H'
+    assert sparse.get_enemy_board() == {(0, 1): 'S', (1, 1): 'S', (0, 3): 'H'}
+    assert dense.get_remaining_ships() == sparse.get_remaining_ships()